@@ -0,0 +1,66 @@
+"""Timing for the precedence-constrained revision knapsack.
+
+Run from the repository root:
+
+    python benchmarks/revision_knapsack.py
+
+Builds random revision sets (forest-shaped and general prerequisite DAGs)
+and times RevisionOptimizer in 'precedence' mode, next to the plain
+'zero_one' mode for reference.
+"""
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from intelliplan import RevisionOptimizer  # noqa: E402
+
+
+def make_topics(count, shape, seed):
+    rng = random.Random(seed)
+    topics = []
+    for i in range(count):
+        if i == 0 or rng.random() < 0.2:
+            dependencies = []
+        elif shape == 'forest':
+            dependencies = [rng.randint(1, i)]
+        else:
+            dependencies = sorted({rng.randint(max(1, i - 30), i) for _ in range(rng.randint(1, 3))})
+        topics.append({
+            'id': i + 1,
+            'name': f'Topic {i + 1}',
+            'estimated_hours': rng.choice([0.25, 0.5, 0.75, 1, 1.5, 2, 3]),
+            'importance': rng.randint(1, 5),
+            'dependencies': dependencies
+        })
+    return topics
+
+
+def run(topics, hours, mode):
+    optimizer = RevisionOptimizer(topics, hours, mode)
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        chosen = optimizer.knapsack_optimize()
+    elapsed = time.perf_counter() - started
+    return elapsed, len(chosen), optimizer.solver_stats
+
+
+def main():
+    print(f"{'topics':>6} {'shape':>6} {'hours':>5} {'mode':>10} {'solver':>10} {'ms':>8} {'picked':>6} {'gap':>6}")
+    for count in (200, 400, 800):
+        for shape in ('forest', 'dag'):
+            topics = make_topics(count, shape, seed=count)
+            for hours in (24, 100):
+                for mode in ('zero_one', 'precedence'):
+                    elapsed, picked, stats = run(topics, hours, mode)
+                    gap = stats.get('optimality_gap')
+                    print(f"{count:>6} {shape:>6} {hours:>5} {mode:>10} {stats['solver_mode']:>10} "
+                          f"{elapsed * 1000:>8.1f} {picked:>6} {'' if gap is None else f'{gap:.3f}':>6}")
+
+
+if __name__ == '__main__':
+    main()
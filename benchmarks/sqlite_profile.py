@@ -0,0 +1,101 @@
+"""Read/write throughput of the SQLite storage profiles under concurrent load.
+
+Run from the repository root:
+
+    python benchmarks/sqlite_profile.py [seconds] [writers] [readers]
+
+For each profile in SQLITE_PROFILES a fresh database file is created in a
+temporary directory. Writer threads insert chat messages (one commit
+each) while reader threads page through a group's latest messages, all
+through SQLAlchemy engines so the app's connect hook sets the pragmas.
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+
+import intelliplan  # noqa: E402
+
+SCHEMA = [
+    'CREATE TABLE group_message (id INTEGER PRIMARY KEY, group_id INTEGER NOT NULL, '
+    'user_id INTEGER NOT NULL, message TEXT NOT NULL, timestamp DATETIME)',
+    'CREATE INDEX ix_group_message_group_timestamp ON group_message (group_id, timestamp)',
+]
+
+
+def run_profile(profile, seconds, writers, readers):
+    intelliplan.app.config['SQLITE_PRAGMAS'] = dict(intelliplan.SQLITE_PROFILES[profile])
+    directory = tempfile.mkdtemp(prefix=f'intelliplan-{profile}-')
+    engine = create_engine(f'sqlite:///{os.path.join(directory, "bench.db")}',
+                           pool_size=writers + readers, connect_args={'timeout': 0.1})
+    with engine.begin() as connection:
+        for statement in SCHEMA:
+            connection.execute(text(statement))
+        connection.execute(text(
+            "INSERT INTO group_message (group_id, user_id, message, timestamp) VALUES (:g, 1, 'seed', datetime('now'))"
+        ), [{'g': i % 10} for i in range(5000)])
+
+    counts = {'writes': 0, 'reads': 0, 'locked': 0}
+    lock = threading.Lock()
+    stop = time.monotonic() + seconds
+
+    def writer(worker):
+        done = locked = 0
+        while time.monotonic() < stop:
+            try:
+                with engine.begin() as connection:
+                    connection.execute(text(
+                        "INSERT INTO group_message (group_id, user_id, message, timestamp) "
+                        "VALUES (:g, :u, 'hello', datetime('now'))"
+                    ), {'g': done % 10, 'u': worker})
+                done += 1
+            except OperationalError:
+                locked += 1
+        with lock:
+            counts['writes'] += done
+            counts['locked'] += locked
+
+    def reader(worker):
+        done = locked = 0
+        while time.monotonic() < stop:
+            try:
+                with engine.connect() as connection:
+                    connection.execute(text(
+                        'SELECT id, message FROM group_message WHERE group_id = :g ORDER BY timestamp DESC LIMIT 50'
+                    ), {'g': done % 10}).fetchall()
+                done += 1
+            except OperationalError:
+                locked += 1
+        with lock:
+            counts['reads'] += done
+            counts['locked'] += locked
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    threads += [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+    return counts
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3
+    writers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    readers = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    print(f'{seconds:g}s, {writers} writer and {readers} reader threads')
+    print(f"{'profile':>12} {'writes/s':>10} {'reads/s':>10} {'locked':>8}")
+    for profile in intelliplan.SQLITE_PROFILES:
+        counts = run_profile(profile, seconds, writers, readers)
+        print(f"{profile:>12} {counts['writes'] / seconds:>10.0f} {counts['reads'] / seconds:>10.0f} {counts['locked']:>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+import os
+import sys
+import tempfile
+
+import pytest
+from sqlalchemy import event
+
+# Point the app at a throwaway database before it is imported. The tests
+# drop every table, so never reuse DATABASE_URL from the shell; set
+# TEST_DATABASE_URL to run them against a scratch PostgreSQL database instead.
+TEST_DB_DIR = tempfile.mkdtemp(prefix='intelliplan-tests-')
+os.environ['DATABASE_URL'] = os.environ.get(
+    'TEST_DATABASE_URL', f'sqlite:///{os.path.join(TEST_DB_DIR, "intelliplan.db")}'
+)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import intelliplan  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    intelliplan.app.config['TESTING'] = True
+    with intelliplan.app.app_context():
+        intelliplan.db.drop_all()
+        intelliplan.db.create_all()
+    yield intelliplan.app
+    with intelliplan.app.app_context():
+        intelliplan.db.session.remove()
+
+
+@pytest.fixture
+def client(app):
+    client = app.test_client()
+    client.post('/register', data={'username': 'student', 'email': 'student@example.com', 'password': 'secret'})
+    client.post('/login', data={'username': 'student', 'password': 'secret'})
+    return client
+
+
+@pytest.fixture
+def user(app, client):
+    with app.app_context():
+        return intelliplan.User.query.filter_by(username='student').one().id
+
+
+@pytest.fixture
+def statements(app):
+    """SQL statements sent to the database while the test runs."""
+    executed = []
+
+    def record(connection, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    with app.app_context():
+        engine = intelliplan.db.engine
+    event.listen(engine, 'before_cursor_execute', record)
+    yield executed
+    event.remove(engine, 'before_cursor_execute', record)
@@ -0,0 +1,92 @@
+"""Timezone-aware study streaks and the DailyActivity rollup behind them."""
+import datetime
+import types
+
+import pytest
+
+import intelliplan
+from intelliplan import DailyActivity
+
+# Midnight 10 March 2026 in Tokyo (UTC+9) is 15:00 UTC on 9 March
+LOCAL_MIDNIGHT_UTC = datetime.datetime(2026, 3, 9, 15, 0)
+BEFORE_MIDNIGHT = LOCAL_MIDNIGHT_UTC - datetime.timedelta(minutes=5)
+AFTER_MIDNIGHT = LOCAL_MIDNIGHT_UTC + datetime.timedelta(minutes=5)
+
+
+class FrozenDatetime(datetime.datetime):
+    frozen = None
+
+    @classmethod
+    def utcnow(cls):
+        return cls.frozen
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Sets the time intelliplan sees as now (naive UTC)."""
+    monkeypatch.setattr(intelliplan, 'datetime', types.SimpleNamespace(
+        datetime=FrozenDatetime, date=datetime.date,
+        timedelta=datetime.timedelta, timezone=datetime.timezone
+    ))
+
+    def set_now(moment):
+        FrozenDatetime.frozen = moment
+    return set_now
+
+
+def set_timezone(client, timezone):
+    response = client.put('/api/user/settings', json={'settings': {'timezone': timezone}})
+    assert response.get_json()['success']
+
+
+def save_session(client, clock, moment, duration, completed=True):
+    clock(moment)
+    response = client.post('/save-session', json={'duration': duration, 'completed': completed})
+    assert response.get_json()['success']
+
+
+def rollup(app, user):
+    with app.app_context():
+        return {row.day: (row.sessions, row.minutes)
+                for row in DailyActivity.query.filter_by(user_id=user)}
+
+
+def streak(client):
+    return client.get('/get-user-stats').get_json()['stats']['streak']
+
+
+def test_sessions_either_side_of_local_midnight(app, client, user, clock):
+    set_timezone(client, 'Asia/Tokyo')
+    save_session(client, clock, BEFORE_MIDNIGHT, 25)
+    save_session(client, clock, AFTER_MIDNIGHT, 30)
+    save_session(client, clock, AFTER_MIDNIGHT, 50, completed=False)
+
+    # Same UTC day, but two calendar days in Tokyo
+    assert rollup(app, user) == {
+        datetime.date(2026, 3, 9): (1, 25),
+        datetime.date(2026, 3, 10): (1, 30),
+    }
+    assert streak(client) == 2
+
+    # Two days later in Tokyo, with nothing studied the day before
+    clock(AFTER_MIDNIGHT + datetime.timedelta(days=2))
+    assert streak(client) == 0
+    save_session(client, clock, AFTER_MIDNIGHT + datetime.timedelta(days=2), 25)
+    assert streak(client) == 1
+
+
+def test_timezone_change_rebuilds_the_rollup(app, client, user, clock):
+    set_timezone(client, 'Asia/Tokyo')
+    save_session(client, clock, BEFORE_MIDNIGHT, 25)
+    save_session(client, clock, AFTER_MIDNIGHT, 30)
+
+    set_timezone(client, 'UTC')
+    assert rollup(app, user) == {datetime.date(2026, 3, 9): (2, 55)}
+    assert streak(client) == 1
+
+    set_timezone(client, 'Asia/Tokyo')
+    assert rollup(app, user) == {
+        datetime.date(2026, 3, 9): (1, 25),
+        datetime.date(2026, 3, 10): (1, 30),
+    }
+    assert streak(client) == 2
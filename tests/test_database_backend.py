@@ -0,0 +1,41 @@
+"""Dialect-specific write paths. Runs on TEST_DATABASE_URL when set, else a temporary SQLite file."""
+import intelliplan
+from intelliplan import BreakTime, Subject, Topic, db
+
+
+def make_topics(user_id, count=2):
+    subject = Subject(name='Physics', user_id=user_id)
+    db.session.add(subject)
+    db.session.flush()
+    topics = [Topic(name=f'Topic {i}', subject_id=subject.id) for i in range(count)]
+    db.session.add_all(topics)
+    db.session.commit()
+    return subject.id, [topic.id for topic in topics]
+
+
+def break_minutes(subject_id):
+    return {(row.from_topic_id, row.to_topic_id): row.break_minutes
+            for row in BreakTime.query.filter_by(subject_id=subject_id)}
+
+
+def test_break_time_upsert_inserts_then_updates(app, user, statements):
+    with app.app_context():
+        subject_id, (first, second) = make_topics(user)
+        statements.clear()
+        assert intelliplan.save_break_time_to_db(subject_id, first, second, 10)
+        assert intelliplan.save_break_time_to_db(subject_id, first, second, 25)
+        assert intelliplan.save_break_time_to_db(subject_id, second, first, 5)
+        assert break_minutes(subject_id) == {(first, second): 25, (second, first): 5}
+        dialect = db.engine.dialect.name
+    if dialect in intelliplan.UPSERT_INSERTS:
+        assert sum('ON CONFLICT' in statement for statement in statements) == 3
+
+
+def test_break_time_save_without_upsert_support(app, user, monkeypatch):
+    monkeypatch.setattr(intelliplan, 'UPSERT_INSERTS', {})
+    with app.app_context():
+        subject_id, (first, second) = make_topics(user)
+        assert intelliplan.save_break_time_to_db(subject_id, first, second, 10)
+        assert intelliplan.save_break_time_to_db(subject_id, first, second, 30)
+        assert break_minutes(subject_id) == {(first, second): 30}
+
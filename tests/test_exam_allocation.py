@@ -0,0 +1,49 @@
+"""Request validation of /algorithm/exam-allocation."""
+import json
+
+import pytest
+
+from intelliplan import StudyPlan, Subject, Topic, db
+
+
+@pytest.fixture
+def plan_id(app, user):
+    with app.app_context():
+        subject = Subject(name='Chemistry', user_id=user)
+        db.session.add(subject)
+        db.session.flush()
+        topic = Topic(name='Bonds', subject_id=subject.id, is_completed=True, estimated_hours=2, importance=3)
+        plan = StudyPlan(name='Finals', user_id=user, subjects_data=json.dumps([str(subject.id)]))
+        db.session.add_all([topic, plan])
+        db.session.commit()
+        return plan.id
+
+
+@pytest.mark.parametrize('make_body', [
+    lambda plan_id: ['not', 'an', 'object'],
+    lambda plan_id: {'hoursPerDay': 2, 'plans': {'planId': plan_id}},
+    lambda plan_id: {'hoursPerDay': 2, 'plans': [plan_id]},
+    lambda plan_id: {'hoursPerDay': 2, 'plans': [{'planId': 'abc', 'daysUntilExam': 3}]},
+    lambda plan_id: {'hoursPerDay': 2, 'plans': [{'planId': plan_id, 'daysUntilExam': 3, 'topicSettings': {'id': 1}}]},
+    lambda plan_id: {'hoursPerDay': 2, 'plans': [{'planId': plan_id, 'daysUntilExam': 3, 'topicSettings': [{'estHours': 1}]}]},
+    lambda plan_id: {'hoursPerDay': 2, 'plans': [{'planId': plan_id, 'daysUntilExam': 3, 'topicSettings': ['x']}]},
+    lambda plan_id: {'hoursPerDay': 2, 'plans': [{'planId': plan_id, 'daysUntilExam': 3,
+                                                 'topicSettings': [{'id': 1, 'importance': 'high'}]}]},
+])
+def test_malformed_body_is_a_json_400(client, plan_id, make_body):
+    response = client.post('/algorithm/exam-allocation', json=make_body(plan_id))
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+def test_topic_settings_override_hours(client, plan_id, app):
+    with app.app_context():
+        topic_id = Topic.query.filter_by(name='Bonds').one().id
+    response = client.post('/algorithm/exam-allocation', json={
+        'hoursPerDay': 1,
+        'plans': [{'planId': plan_id, 'daysUntilExam': 3,
+                   'topicSettings': [{'id': str(topic_id), 'estHours': '1', 'importance': 5}]}]
+    })
+    assert response.status_code == 200
+    plan = response.get_json()['plans'][0]
+    assert plan['allocatedHours'] == 1
@@ -0,0 +1,39 @@
+"""Prerequisite-respecting study break order (SequentialOrderingOptimizer)."""
+import random
+
+import numpy as np
+
+import intelliplan
+
+
+def random_subject(n, links, seed):
+    rng = random.Random(seed)
+    topics = [{'id': i + 1, 'name': f'Topic {i}', 'dependencies': []} for i in range(n)]
+    edges = set()
+    for _ in range(links):
+        before, after = sorted(rng.sample(range(n), 2))
+        edges.add((before, after))
+        topics[after]['dependencies'].append(before + 1)
+    matrix = np.random.RandomState(seed).randint(0, 60, (n, n)).astype(float)
+    return topics, edges, matrix
+
+
+def test_closed_subset_bound_is_an_upper_bound():
+    for seed in range(20):
+        topics, edges, _ = random_subject(10, seed % 15, seed)
+        masks = [sum(1 << a for a, b in edges if b == topic) for topic in range(10)]
+        closed = sum(
+            1 for subset in range(1 << 10)
+            if all(not subset >> topic & 1 or masks[topic] & ~subset == 0 for topic in range(10))
+        )
+        assert intelliplan.closed_subset_bound(masks) >= closed
+
+
+def test_large_loose_subject_skips_the_dp_and_keeps_prerequisites():
+    topics, edges, matrix = random_subject(45, 20, seed=3)
+    optimizer = intelliplan.SequentialOrderingOptimizer(topics, matrix, time_budget=0.1)
+    order, total, breaks = optimizer.optimize_schedule()
+    assert optimizer.solver_stats['mode'] == 'heuristic'
+    position = {topic['id'] - 1: k for k, topic in enumerate(order)}
+    assert all(position[before] < position[after] for before, after in edges)
+    assert abs(sum(breaks) - total) < 0.1
@@ -0,0 +1,56 @@
+"""The stats pages must not issue more queries as a user's data grows."""
+import datetime
+
+import pytest
+
+import intelliplan
+from intelliplan import PomodoroSession, Subject, Topic, db
+
+
+def add_study_data(user_id, subjects, topics_per_subject=4, sessions=5):
+    for s in range(subjects):
+        subject = Subject(name=f'Subject {s}', user_id=user_id)
+        db.session.add(subject)
+        db.session.flush()
+        for t in range(topics_per_subject):
+            db.session.add(Topic(name=f'Topic {t}', subject_id=subject.id, is_completed=t % 2 == 0))
+    for day in range(sessions):
+        db.session.add(PomodoroSession(
+            user_id=user_id, duration=25, completed=True,
+            created_at=datetime.datetime.utcnow() - datetime.timedelta(days=day)
+        ))
+    db.session.commit()
+
+
+# One statement loads the logged-in user, the rest answer the page
+@pytest.mark.parametrize('url, expected', [
+    ('/dashboard', 3),
+    ('/progress', 3),
+    ('/get-user-stats', 3),
+])
+def test_stats_query_count_does_not_grow(app, client, user, statements, url, expected):
+    with app.app_context():
+        add_study_data(user, subjects=2)
+    statements.clear()
+    assert client.get(url).status_code == 200
+    assert len(statements) == expected
+
+    with app.app_context():
+        add_study_data(user, subjects=10, sessions=20)
+    statements.clear()
+    assert client.get(url).status_code == 200
+    assert len(statements) == expected
+
+
+def test_stats_totals(app, client, user):
+    with app.app_context():
+        add_study_data(user, subjects=3, topics_per_subject=4, sessions=2)
+        db.session.add(PomodoroSession(user_id=user, duration=50, completed=False))
+        db.session.commit()
+        assert intelliplan.session_totals(user) == (2, 50)
+        progress = intelliplan.subject_progress(user)
+    assert [(row['total'], row['completed']) for row in progress] == [(4, 2)] * 3
+
+    stats = client.get('/get-user-stats').get_json()['stats']
+    assert stats['completedSessions'] == 2
+    assert stats['totalStudyTime'] == 50
@@ -0,0 +1,60 @@
+"""Stored topological ranks for subjects with and without a prerequisite cycle."""
+import pytest
+
+import intelliplan
+from intelliplan import Subject, Topic, TopicDependency, db
+
+
+def make_subject(user_id, names, edges):
+    """edges: (topic, prerequisite) name pairs."""
+    subject = Subject(name='Chemistry', user_id=user_id)
+    db.session.add(subject)
+    db.session.flush()
+    topics = {name: Topic(name=name, subject_id=subject.id) for name in names}
+    db.session.add_all(topics.values())
+    db.session.flush()
+    db.session.add_all([
+        TopicDependency(topic_id=topics[topic].id, prerequisite_id=topics[prerequisite].id, subject_id=subject.id)
+        for topic, prerequisite in edges
+    ])
+    db.session.commit()
+    return subject.id, topics
+
+
+def forbid_full_sort(monkeypatch):
+    def fail(*args, **kwargs):
+        pytest.fail('ensure_topic_order re-sorted a subject whose ranks were already stored')
+    monkeypatch.setattr(intelliplan, 'TopologicalSort', fail)
+
+
+def test_cycle_keeps_the_stored_order(app, user, monkeypatch):
+    with app.app_context():
+        subject_id, topics = make_subject(
+            user, ['Atoms', 'Bonds', 'Reactions', 'Safety'],
+            [('Atoms', 'Bonds'), ('Bonds', 'Atoms'), ('Reactions', 'Atoms')]
+        )
+        intelliplan.ensure_topic_order(subject_id)
+        db.session.commit()
+        assert [topics[name].topo_rank for name in ('Atoms', 'Bonds', 'Reactions')] == [None, None, None]
+        assert topics['Safety'].topo_rank == 0
+
+        forbid_full_sort(monkeypatch)
+        ordered = intelliplan.ensure_topic_order(subject_id)
+        assert [topic.id for topic in ordered] == sorted(topic.id for topic in topics.values())
+
+
+def test_unranked_topic_outside_a_cycle_is_ranked(app, user):
+    with app.app_context():
+        subject_id, topics = make_subject(
+            user, ['Atoms', 'Bonds', 'Safety'], [('Atoms', 'Bonds'), ('Bonds', 'Atoms')]
+        )
+        intelliplan.ensure_topic_order(subject_id)
+        db.session.commit()
+        # An imported topic arrives without a rank
+        imported = Topic(name='Lab work', subject_id=subject_id)
+        db.session.add(imported)
+        db.session.commit()
+
+        intelliplan.ensure_topic_order(subject_id)
+        assert imported.topo_rank is not None
+        assert topics['Atoms'].topo_rank is None